@@ -6,22 +6,30 @@
 
 """Pytest configuration file."""
 
+from __future__ import annotations
+
 import warnings
 from collections.abc import Iterator
-from contextlib import ExitStack
-from typing import Union
+from contextlib import AbstractContextManager
 from unittest.mock import Mock
 
-import jpype  # type: ignore[import-untyped]
 import pytest
-from pjlsa import LSAClient  # type: ignore[import-untyped]
 
-exit_stack = ExitStack()
+_java_api: AbstractContextManager | None = None
 
 collect_ignore: list[str] = []
 
+# Stand-in for the trim service when the LSA tests are ignored anyway.
+_NULL_MOCK = Mock(spec=object())
+
 
 def pytest_sessionstart(session: pytest.Session) -> None:
+    global _java_api
+    # Import lazily so that e.g. `pytest --help` doesn't have to
+    # load JPype.
+    import jpype  # type: ignore[import-untyped]
+    from pjlsa import LSAClient  # type: ignore[import-untyped]
+
     try:
         lsa_client = LSAClient(server="next")
     except jpype.JVMNotFoundException:
@@ -36,22 +44,43 @@ def pytest_sessionstart(session: pytest.Session) -> None:
             )
         )
     else:
-        exit_stack.enter_context(lsa_client.java_api())
+        _java_api = lsa_client.java_api()
+        _java_api.__enter__()
 
 
 def pytest_sessionfinish(
-    session: pytest.Session, exitstatus: Union[int, pytest.ExitCode]
+    session: pytest.Session, exitstatus: int | pytest.ExitCode
 ) -> None:
-    exit_stack.close()
+    global _java_api
+    if _java_api is not None:
+        _java_api.__exit__(None, None, None)
+        _java_api = None
 
 
-@pytest.fixture(autouse=True)
-def trim_service(monkeypatch: pytest.MonkeyPatch) -> Iterator[Mock]:
-    if jpype.isJVMStarted():
-        from cernml.lsa_utils import _services
+@pytest.fixture(scope="session")
+def _session_trim_service() -> Iterator[Mock]:
+    import jpype
 
-        service = Mock(spec=_services.TrimService)
-        monkeypatch.setattr(_services, "trim", service)
-    else:
-        service = Mock(spec=object())
+    if not jpype.isJVMStarted():
+        yield _NULL_MOCK
+        return
+    from cernml.lsa_utils import _services
+
+    service = Mock(spec=_services.TrimService)
+    original = _services.trim
+    _services.trim = service
+    try:
+        yield service
+    finally:
+        _services.trim = original
+
+
+@pytest.fixture(autouse=True)
+def trim_service(_session_trim_service: Mock) -> Mock:
+    # Creating and patching in the mock is expensive, so we do it only
+    # once per session. Resetting it is enough to isolate tests. Most
+    # tests never touch it at all, so we even skip that if possible.
+    service = _session_trim_service
+    if service.mock_calls or service._mock_children:
+        service.reset_mock(return_value=True, side_effect=True)
     return service
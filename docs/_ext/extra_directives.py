@@ -15,6 +15,7 @@ These custom directives are:
 
 from __future__ import annotations
 
+import functools
 import typing as t
 from logging import getLogger
 
@@ -36,14 +37,47 @@ from sphinx.errors import ExtensionError
 from sphinx.roles import XRefRole
 
 if t.TYPE_CHECKING:
-    from docutils.nodes import TextElement
+    from docutils.nodes import Node, TextElement
     from docutils.parsers.rst import Directive
     from sphinx.addnodes import desc_signature
     from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
     from sphinx.util.typing import ExtensionMetadata, OptionSpec
 
 LOG = getLogger(__name__)
 
+_normalize_ws = functools.partial(sphinx.util.ws_re.sub, " ")
+
+
+def parse_annotation(annotation: str, env: BuildEnvironment) -> list[Node]:
+    """Cached version of Sphinx's internal `_parse_annotation()`.
+
+    The same few annotations appear over and over again in our docs.
+    The result depends on the current module and class, so these are
+    part of the cache key. The returned nodes are always fresh copies,
+    since nodes must not be shared between signatures.
+    """
+    nodes = _parse_annotation_cached(
+        annotation,
+        env,
+        env.ref_context.get("py:module"),
+        env.ref_context.get("py:class"),
+    )
+    return [node.deepcopy() for node in nodes]
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_annotation_cached(
+    annotation: str,
+    env: BuildEnvironment,
+    module: str | None,
+    cls: str | None,
+) -> tuple[Node, ...]:
+    # Module and class are only passed to be part of the cache key.
+    # The cache holds a reference to *env*, so its identity cannot be
+    # reused by a later environment while an entry is still cached.
+    return tuple(_parse_annotation(annotation, env))
+
 
 def add_object_type(
     app: Sphinx,
@@ -67,14 +101,20 @@ def add_object_type(
     object_types[directivename] = ObjType(objname or directivename, rolename)
 
 
+# Options of all directives that only take a return type. Each directive
+# gets its own copy, so that changing one doesn't affect the others.
+_RTYPE_OPTION_SPEC: OptionSpec = {
+    **GenericObject.option_spec,
+    "rtype": directives.unchanged,
+}
+
+
 class GenericDictKey(GenericObject):
-    option_spec: t.ClassVar[OptionSpec] = GenericObject.option_spec.copy()
-    option_spec.update(
-        {
-            "type": directives.unchanged,
-            "value": directives.unchanged,
-        }
-    )
+    option_spec: t.ClassVar[OptionSpec] = {
+        **GenericObject.option_spec,
+        "type": directives.unchanged,
+        "value": directives.unchanged,
+    }
 
     dict_name: str = "dict"
 
@@ -82,13 +122,17 @@ class GenericDictKey(GenericObject):
         if not sig[0] == sig[-1] == '"':
             raise ValueError
         signode.clear()
-        signode += desc_addname("", self.dict_name, desc_sig_punctuation("", "["))
-        signode += desc_name(sig, sig)
-        signode += desc_addname("", "", desc_sig_punctuation("", "]"))
+        signode.extend(
+            [
+                desc_addname("", self.dict_name, desc_sig_punctuation("", "[")),
+                desc_name(sig, sig),
+                desc_addname("", "", desc_sig_punctuation("", "]")),
+            ]
+        )
         signode["_toc_name"] = sig
-        refname = sphinx.util.ws_re.sub(" ", sig)
+        refname = _normalize_ws(sig)
         if typ := self.options.get("type"):
-            annotations = _parse_annotation(typ, self.env)
+            annotations = parse_annotation(typ, self.env)
             signode += desc_annotation(
                 typ, "", desc_sig_punctuation("", ":"), desc_sig_space(), *annotations
             )
@@ -123,8 +167,7 @@ class InfoDictKey(GenericDictKey):
 
 
 class RenderMode(GenericObject):
-    option_spec: t.ClassVar[OptionSpec] = GenericObject.option_spec.copy()
-    option_spec.update({"rtype": directives.unchanged})
+    option_spec: t.ClassVar[OptionSpec] = {**_RTYPE_OPTION_SPEC}
 
     indextemplate = "render mode; %s"
 
@@ -133,9 +176,9 @@ class RenderMode(GenericObject):
         signode += desc_annotation("", "render mode", desc_sig_space())
         signode += desc_name(sig, sig)
         signode["_toc_name"] = sig
-        refname = sphinx.util.ws_re.sub(" ", sig)
+        refname = _normalize_ws(sig)
         if rtype := self.options.get("rtype"):
-            annotations = _parse_annotation(rtype, self.env)
+            annotations = parse_annotation(rtype, self.env)
             signode += desc_returns(rtype, "", *annotations)
         return refname
 
@@ -149,8 +192,7 @@ class RenderMode(GenericObject):
 
 
 class EntryPointGroup(GenericObject):
-    option_spec: t.ClassVar[OptionSpec] = GenericObject.option_spec.copy()
-    option_spec.update({"rtype": directives.unchanged})
+    option_spec: t.ClassVar[OptionSpec] = {**_RTYPE_OPTION_SPEC}
 
     indextemplate = "entry point; %s"
 
@@ -159,9 +201,9 @@ class EntryPointGroup(GenericObject):
         signode += desc_annotation("", "entry point group", desc_sig_space())
         signode += desc_name(sig, sig)
         signode["_toc_name"] = sig
-        refname = sphinx.util.ws_re.sub(" ", sig)
+        refname = _normalize_ws(sig)
         if rtype := self.options.get("rtype"):
-            annotations = _parse_annotation(rtype, self.env)
+            annotations = parse_annotation(rtype, self.env)
             signode += desc_returns(rtype, "", *annotations)
         return refname
 
@@ -181,7 +223,7 @@ class InstallExtra(GenericObject):
         signode.clear()
         signode += desc_name(sig, sig)
         signode["_toc_name"] = sig
-        return sphinx.util.ws_re.sub(" ", sig)
+        return _normalize_ws(sig)
 
     def _toc_entry_name(self, sig_node: desc_signature) -> str:
         return sig_node.get("_toc_name", "")
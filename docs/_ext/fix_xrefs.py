@@ -11,6 +11,7 @@ from __future__ import annotations
 import enum
 import logging
 import re
+import sys
 import typing as t
 
 from docutils.nodes import Element, Text, TextElement, reference
@@ -19,38 +20,47 @@ from sphinx.ext import intersphinx
 if t.TYPE_CHECKING:
     from sphinx.addnodes import pending_xref
     from sphinx.application import Sphinx
+    from sphinx.config import Config
     from sphinx.environment import BuildEnvironment
     from sphinx.util.typing import ExtensionMetadata
 
 LOG = logging.getLogger(__name__)
 
-T = t.TypeVar("T", bound=t.Callable)
+_TYPING_NAMES = frozenset(dir(t))
 
+if sys.version_info >= (3, 11):
+    member = enum.member
+else:
+    T = t.TypeVar("T", bound=t.Callable)
 
-class nondescriptor(t.Generic[T]):
-    """Function wrapper that can be used as enum value."""
+    class member(t.Generic[T]):
+        """Function wrapper that can be used as enum value."""
 
-    __slots__ = ("__func__", "__call__")
+        __slots__ = ("__call__", "__func__")
 
-    def __init__(self, func: T) -> None:
-        self.__call__ = self.__func__ = func
+        def __init__(self, func: T) -> None:
+            # Static methods only became callable in Python 3.10.
+            self.__call__ = self.__func__ = getattr(func, "__func__", func)
 
 
 @enum.unique
 class TransformKind(enum.Enum):
     """The first element of tuples for transform rules."""
 
-    @nondescriptor
+    @member
     @staticmethod
     def CONST(match: re.Match[str], arg: str) -> str:
         """Replace the entire target with *arg*."""
         return arg
 
-    @nondescriptor
+    @member
     @staticmethod
     def SUB(match: re.Match[str], arg: str) -> str:
         """Replace the matched part of the target with *arg*."""
-        return match.re.sub(arg, match.string, 1)
+        # Same as `match.re.sub(arg, match.string, 1)`, but reuses the
+        # match instead of searching again.
+        target = match.string
+        return target[: match.start()] + match.expand(arg) + target[match.end() :]
 
 
 class ExternalRef(t.TypedDict):
@@ -70,6 +80,182 @@ class XrefRule(t.TypedDict, total=False):
     external: ExternalRef
 
 
+class CompiledRules(t.NamedTuple):
+    """The configured rules, with their patterns compiled."""
+
+    rules: list[XrefRule]
+    patterns: list[t.Pattern[str]]
+    combined: t.Pattern[str] | None
+    prefixes: tuple[str, ...]
+    unprefixed: tuple[int, ...]
+
+    @classmethod
+    def compile(cls, rules: list[XrefRule]) -> CompiledRules:
+        """Compile all rule patterns, both alone and into one regex.
+
+        Each rule becomes one alternative of the form
+        :samp:`(?=.*?(?P<r{i}>{pattern}))`. The combined regex is
+        matched at the start of the target, so the alternatives are
+        tried in order and the first *rule* that matches anywhere wins.
+        This gives the same result as searching with each rule in turn,
+        but takes one combined scan of the target, plus one confirming
+        search with the winning rule's own pattern.
+
+        Patterns with flags or groups of their own cannot be merged
+        safely. If there are any, *combined* is None and `find()`
+        searches rule by rule.
+
+        Patterns that are anchored at the start and begin with a literal
+        contribute it to *prefixes*. Targets that start with none of
+        them cannot match any of these rules. For such targets, only the
+        rules listed in *unprefixed* are tried, one by one. Usually,
+        there are none and no regex needs to run at all.
+        """
+        rules = list(map(resolve_kinds, rules))
+        patterns = [re.compile(rule["pattern"]) for rule in rules]
+        literals = list(map(literal_prefix, patterns))
+        prefixes = tuple(filter(None, literals))
+        unprefixed = tuple(i for i, literal in enumerate(literals) if not literal)
+        if any(p.flags != re.UNICODE or p.groups for p in patterns):
+            return cls(rules, patterns, None, prefixes, unprefixed)
+        alternatives = "|".join(
+            f"(?=(?s:.*?)(?P<r{i}>{p.pattern}))" for i, p in enumerate(patterns)
+        )
+        try:
+            combined = re.compile(alternatives)
+        except re.error:
+            combined = None
+        return cls(rules, patterns, combined, prefixes, unprefixed)
+
+    def find(self, target: str) -> tuple[XrefRule, re.Match[str]] | None:
+        """Return the first rule that matches *target* and its match."""
+        if self.prefixes and not target.startswith(self.prefixes):
+            for index in self.unprefixed:
+                if match := self.patterns[index].search(target):
+                    return self.rules[index], match
+            return None
+        if self.combined:
+            found = self.combined.match(target)
+            if not found or not found.lastgroup:
+                return None
+            index = int(found.lastgroup[1:])
+            # Search again to get a match object that belongs to the
+            # rule's own pattern. `TransformKind.SUB` depends on this.
+            match = self.patterns[index].search(target)
+            assert match, (target, self.patterns[index])
+            return self.rules[index], match
+        for rule, pattern in zip(self.rules, self.patterns):
+            if match := pattern.search(target):
+                return rule, match
+        return None
+
+
+_compiled_rules = CompiledRules([], [], None, (), ())
+
+
+def literal_prefix(pattern: t.Pattern[str]) -> str:
+    """Return the literal text that every match of *pattern* starts with.
+
+    This only looks at patterns anchored with ``^`` and is conservative:
+    an empty string means that no prefix could be determined.
+
+        >>> literal_prefix(re.compile(r"^np\\.ndarray"))
+        'np.ndarray'
+        >>> literal_prefix(re.compile(r"^cernml\\..*\\.T$"))
+        'cernml.'
+        >>> literal_prefix(re.compile(r"^ab?c"))
+        'a'
+        >>> literal_prefix(re.compile(r"^cernml\\.(?:a|b)"))
+        'cernml.'
+        >>> literal_prefix(re.compile(r"^a|b"))
+        ''
+        >>> literal_prefix(re.compile(r"Value$"))
+        ''
+    """
+    source = pattern.pattern
+    if (
+        pattern.flags != re.UNICODE
+        or not source.startswith("^")
+        or has_top_level_alternation(source)
+    ):
+        return ""
+    prefix: list[str] = []
+    chars = iter(source[1:])
+    for char in chars:
+        if char == "\\":
+            escaped = next(chars, "")
+            if not escaped or escaped.isalnum():
+                break
+            prefix.append(escaped)
+        elif char in "*?{":
+            # The preceding character is optional.
+            if prefix:
+                prefix.pop()
+            break
+        elif char in ".^$+[]()":
+            break
+        else:
+            prefix.append(char)
+    return "".join(prefix)
+
+
+def has_top_level_alternation(source: str) -> bool:
+    """Return True if the regex *source* has a ``|`` outside of groups.
+
+    >>> has_top_level_alternation(r"^a|b")
+    True
+    >>> has_top_level_alternation(r"^a(?:b|c)")
+    False
+    >>> has_top_level_alternation(r"^a[|]\\|")
+    False
+    """
+    depth = 0
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            i += 1
+        elif char == "[":
+            # Skip the character class. A "]" right at its start is
+            # a literal, not its end.
+            i += 1
+            if source.startswith("^", i):
+                i += 1
+            if source.startswith("]", i):
+                i += 1
+            while i < len(source) and source[i] != "]":
+                i += 2 if source[i] == "\\" else 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and not depth:
+            return True
+        i += 1
+    return False
+
+
+def resolve_kinds(rule: XrefRule) -> XrefRule:
+    """Return a copy of *rule* with all transform kinds as enum members.
+
+    This lets `replace()` skip the name lookup on every call.
+    """
+    rule = rule.copy()
+    for key in ("reftarget", "contnode"):
+        if transform := rule.get(key):
+            kind, arg = t.cast(tuple[t.Union[str, TransformKind], str], transform)
+            if isinstance(kind, str):
+                kind = TransformKind[kind.upper()]
+            rule[key] = (kind, arg)
+    return rule
+
+
+def compile_rules(app: Sphinx, config: Config) -> None:
+    """Compile the configured rules once per build."""
+    global _compiled_rules
+    _compiled_rules = CompiledRules.compile(config.fix_xrefs_rules)
+
+
 def retry_resolve_xref(
     app: Sphinx,
     env: BuildEnvironment,
@@ -118,27 +304,28 @@ def fix_xrefs(
 ) -> Element | None:
     """Link type variables to `typing.TypeVar`."""
     target: str = node["reftarget"]
-    rules: list[XrefRule] = app.config.fix_xrefs_rules
-    for rule in rules:
-        if match := re.search(rule["pattern"], target):
-            if reftype := rule.get("reftype", "obj"):
-                node["reftype"] = reftype
-            if reftarget_transform := rule.get("reftarget"):
-                node["reftarget"] = replace(match, reftarget_transform)
-            if cont_transform := rule.get("contnode"):
-                target = replace(match, cont_transform)
-                contnode = t.cast(TextElement, Text(target))
-            if external := rule.get("external"):
-                uri = external["uri"].format(**node.attributes)
-                package = external["package"].format(**node.attributes)
-                LOG.info("replace xref: %s -> %s", target, uri)
-                return make_external_ref(contnode, uri=uri, package=package)
-            LOG.info("fix xref: %s -> %s", target, node["reftarget"])
-            break
+    if found := _compiled_rules.find(target):
+        rule, match = found
+        if reftype := rule.get("reftype", "obj"):
+            node["reftype"] = reftype
+        if reftarget_transform := rule.get("reftarget"):
+            node["reftarget"] = replace(match, reftarget_transform)
+        if cont_transform := rule.get("contnode"):
+            target = replace(match, cont_transform)
+            contnode = t.cast(TextElement, Text(target))
+        if external := rule.get("external"):
+            uri = external["uri"].format(**node.attributes)
+            package = external["package"].format(**node.attributes)
+            LOG.info("replace xref: %s -> %s", target, uri)
+            return make_external_ref(contnode, uri=uri, package=package)
+        LOG.info("fix xref: %s -> %s", target, node["reftarget"])
+    elif app.config.fix_xrefs_try_typing and target in _TYPING_NAMES:
+        # Some typing members don't get their module resolved.
+        node["reftarget"] = "typing." + target
     else:
-        if app.config.fix_xrefs_try_typing and hasattr(t, target):
-            # Some typing members don't get their module resolved.
-            node["reftarget"] = "typing." + target
+        # Nothing changed, so retrying would fail again. Leave the node
+        # to the other handlers of this event.
+        return None
 
     return retry_resolve_xref(app, env, node, contnode)
 
@@ -148,6 +335,7 @@ def setup(app: Sphinx) -> ExtensionMetadata:
     app.setup_extension("sphinx.ext.intersphinx")
     app.add_config_value("fix_xrefs_rules", [], "env", list[XrefRule])
     app.add_config_value("fix_xrefs_try_typing", False, "env", bool)
+    app.connect("config-inited", compile_rules)
     app.connect("missing-reference", fix_xrefs)
     return {
         "version": "1.0",
@@ -12,7 +12,6 @@ import sys
 import typing as t
 from importlib.abc import Loader, MetaPathFinder
 from importlib.machinery import ModuleSpec
-from unittest.mock import Mock
 
 if t.TYPE_CHECKING:
     from types import ModuleType
@@ -20,22 +19,50 @@ if t.TYPE_CHECKING:
     from sphinx.application import Sphinx
     from sphinx.util.typing import ExtensionMetadata
 
+_ROOT_PACKAGES = frozenset(("cern", "java"))
 
-class MockModule(Mock):
-    """Mock that reproduces only its name under `repr()` and `str()`.
 
-    This class overrides the `__repr__()` method of
-    `~unittest.mock.Mock` to only show the mock name. We do this because
-    Sphinx Autodoc internally uses `repr()` to print types. Without this
-    override, any Java types produced by the `MockLoader` below would
-    appear as ``<Mock name='...', id='...'>`` in the docs.
+class MockModule:
+    """Stand-in for a Java package and anything inside of it.
+
+    Every attribute of this class that isn't a dunder is another
+    `MockModule` whose name is extended by the attribute name. Calling
+    it returns yet another one. All of these are created on first use
+    and then reused.
+
+    Under `repr()` and `str()`, these objects only show their name. We
+    do this because Sphinx Autodoc internally uses `repr()` to print
+    types. Without this, any Java types produced by the `MockLoader`
+    below would appear as ``<MockModule object at ...>`` in the docs.
+
+    We don't use `~unittest.mock.Mock` for this because we need none of
+    its call tracking, and its attribute access is much slower.
     """
 
+    def __init__(self, name: str) -> None:
+        self._mock_name = name
+        self._mock_return_value: MockModule | None = None
+
+    def __getattr__(self, name: str) -> MockModule:
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        child = MockModule(f"{self._mock_name}.{name}")
+        setattr(self, name, child)
+        return child
+
+    def __call__(self, *args: t.Any, **kwargs: t.Any) -> MockModule:
+        if self._mock_return_value is None:
+            self._mock_return_value = MockModule(f"{self._mock_name}()")
+        return self._mock_return_value
+
     def __str__(self) -> str:
-        return self._extract_mock_name()
+        return self._mock_name
 
     def __repr__(self) -> str:
-        return self._extract_mock_name()
+        return self._mock_name
+
+
+_mock_cache: dict[str, MockModule] = {}
 
 
 class MockLoader(Loader, MetaPathFinder):
@@ -56,12 +83,18 @@ class MockLoader(Loader, MetaPathFinder):
         path: t.Sequence[str] | None,
         target: ModuleType | None = None,
     ) -> ModuleSpec | None:
-        if fullname in ("cern", "java") or fullname.startswith(("cern.", "java.")):
+        # This is called for every import, so reject most names early.
+        if fullname[:1] not in ("c", "j"):
+            return None
+        if fullname.partition(".")[0] in _ROOT_PACKAGES:
             return ModuleSpec(fullname, self, is_package=True)
         return None
 
     def create_module(self, spec: ModuleSpec) -> t.Any:
-        return MockModule(name=spec.name)
+        module = _mock_cache.get(spec.name)
+        if module is None:
+            module = _mock_cache[spec.name] = MockModule(name=spec.name)
+        return module
 
     def exec_module(self, module: ModuleType) -> None:
         pass
@@ -69,7 +102,9 @@ class MockLoader(Loader, MetaPathFinder):
 
 def setup(app: Sphinx) -> ExtensionMetadata:
     """Set up hooks into Sphinx."""
-    sys.meta_path.append(MockLoader())
+    # Go first so that the path-based finders never scan `sys.path`
+    # for these packages, which only exist as Java code anyway.
+    sys.meta_path.insert(0, MockLoader())
     return {
         "version": "1.0",
         "parallel_read_safe": True,
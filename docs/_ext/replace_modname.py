@@ -32,6 +32,7 @@ from __future__ import annotations
 
 import importlib
 import inspect
+import types
 import typing as t
 
 if t.TYPE_CHECKING:
@@ -39,16 +40,22 @@ if t.TYPE_CHECKING:
     from sphinx.util.typing import ExtensionMetadata
 
 
-def pubnames(obj: object) -> t.Iterator[str]:
-    """Return an iterator over the public names in an object."""
-    return iter(
-        t.cast(list[str], getattr(obj, "__all__", None))
-        or (
-            name
-            for name, _ in inspect.getmembers_static(obj)
-            if not name.startswith("_")
-        )
-    )
+# Packages that have been fixed up in this process. Rebuilds in the same
+# process (e.g. by sphinx-autobuild) don't need to walk them again.
+_fixed_modnames: set[str] = set()
+
+
+def pubnames(obj: object) -> t.Iterable[str]:
+    """Return an iterable over the public names in an object."""
+    names = getattr(obj, "__all__", None)
+    if names:
+        return tuple(t.cast(list[str], names))
+    # We only need the names, so don't let `inspect.getmembers_static()`
+    # look up every value. Module attributes all live in the module's
+    # `__dict__`; for everything else, `dir()` also lists inherited
+    # names.
+    names = vars(obj) if isinstance(obj, types.ModuleType) else dir(obj)
+    return [name for name in names if not name.startswith("_")]
 
 
 def _is_true_prefix(prefix: str, full: str) -> bool:
@@ -67,8 +74,16 @@ def replace_modname(modname: str) -> None:
     todo: list[object] = [importlib.import_module(modname)]
     while todo:
         parent = todo.pop()
+        # For modules and classes, `inspect.getattr_static()` looks into
+        # their `__dict__` first, so we can do that ourselves. Names that
+        # don't exist at all (e.g. a typo in `__all__`) still raise
+        # AttributeError.
+        namespace = vars(parent) if isinstance(parent, (types.ModuleType, type)) else {}
         for pubname in pubnames(parent):
-            obj = inspect.getattr_static(parent, pubname)
+            if pubname in namespace:
+                obj = namespace[pubname]
+            else:
+                obj = inspect.getattr_static(parent, pubname)
             private_modname = getattr(obj, "__module__", "")
             if private_modname and _is_true_prefix(modname, private_modname):
                 obj.__module__ = modname
@@ -80,9 +95,13 @@ def handle_config_inited(app: Sphinx, config: Config) -> None:
     attr = getattr(config, "replace_modnames", ())
     if isinstance(attr, str):
         raise TypeError("config option 'replace_modnames' must be list of str, not str")
-    modnames = list(attr)
+    # Drop duplicates, but keep the order: it decides which package
+    # an object ends up in if several of them export it.
+    modnames = list(dict.fromkeys(attr))
     for modname in modnames:
-        replace_modname(modname)
+        if modname not in _fixed_modnames:
+            replace_modname(modname)
+            _fixed_modnames.add(modname)
 
 
 def setup(app: Sphinx) -> ExtensionMetadata:
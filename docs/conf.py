@@ -38,18 +38,15 @@ author = "Nico Madysa"
 release = dist.version
 version = release.partition("+")[0]
 
-for entry in dist.metadata.get_all("Project-URL", []):
-    url: str
-    kind, url = entry.split(", ")
-    if kind == "gitlab":
-        gitlab_url = url.removesuffix("/")
-        license_url = f"{gitlab_url}/-/blob/master/COPYING"
-        issues_url = f"{gitlab_url}/-/issues"
-        break
-else:
-    gitlab_url = ""
-    license_url = ""
-    issues_url = ""
+project_urls = {
+    kind: url
+    for kind, _, url in (
+        entry.partition(", ") for entry in dist.metadata.get_all("Project-URL", [])
+    )
+}
+gitlab_url = project_urls.get("gitlab", "").removesuffix("/")
+license_url = f"{gitlab_url}/-/blob/master/COPYING" if gitlab_url else ""
+issues_url = f"{gitlab_url}/-/issues" if gitlab_url else ""
 
 # -- General configuration ---------------------------------------------
 
@@ -153,11 +150,21 @@ intersphinx_mapping = {
     "std": ("https://docs.python.org/3", None),
 }
 
+# Don't let a single unreachable inventory stall the whole build.
+intersphinx_timeout = 5
+# Recent Sphinx versions also keep downloaded inventories next to the
+# doctrees, so that even fresh builds (`-E`) reuse them until they expire.
+intersphinx_cache_limit = 7  # days
+
 # -- Options for custom extension FixXrefs -----------------------------
 
 
 fix_xrefs_rules = [
     {"pattern": r"^cernml\..*\.T$", "reftarget": ("const", "typing.TypeVar")},
+    {
+        "pattern": r"^cernml\..*\.StreamT$",
+        "reftarget": ("const", "typing.TypeVar"),
+    },
     {"pattern": r"^np\.", "reftarget": ("sub", "numpy."), "contnode": ("sub", "")},
     {"pattern": r"^t\.", "reftarget": ("sub", "typing."), "contnode": ("sub", "")},
     {"pattern": r"^Figure$", "reftarget": ("const", "matplotlib.figure.Figure")},
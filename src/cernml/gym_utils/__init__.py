@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import threading
 import typing as t
 
 import numpy as np
@@ -53,7 +54,7 @@ class Scaler:
 
         >>> def lerp(box, t):
         ...     '''Precise, but non-monotonic interpolation.'''
-        ...     return box.high * t + box.low * (np.ones_like(t) - t)
+        ...     return box.high * t + box.low * (1.0 - t)
         >>> box = Box(1.0, 3.0, shape=())
         >>> # Operate close to the low end, this makes addition inexact.
         >>> t1 = np.float32(2.9802322e-8)
@@ -83,6 +84,17 @@ class Scaler:
         >>> scaler.unscale([-1, 1])
         array([-9.8     ,  8.999999], dtype=float32)
 
+    Both methods broadcast their argument against the bounds of the box.
+    This means that a whole batch of points can be transformed in one
+    call by stacking them along a leading axis::
+
+        >>> scaler = Scaler(Box(0, 4, (2,)))
+        >>> batch = [[0, 1], [2, 4], [3, 3]]
+        >>> scaler.scale(batch)
+        array([[-1. , -0.5],
+               [ 0. ,  1. ],
+               [ 0.5,  0.5]], dtype=float32)
+
     Both methods pass the array subclass of the argument through, but
     coerce the dtype to whatever the given space uses::
 
@@ -106,25 +118,71 @@ class Scaler:
         array([-10.,  10.], dtype=float32)
     """
 
+    __slots__ = ("_dtype", "_factor", "_low", "_scaled_space", "_space", "_symmetric")
+
     def __init__(self, space: Box, symmetric: bool = True) -> None:
         if not space.is_bounded():
             raise TypeError(f"space is not bounded: {space}")
         self._space = space
         self._symmetric = symmetric
-
-    def scale(self, unnormalized: np.ndarray) -> np.ndarray:
-        """Rescale an array from [*low*, *high*] to [−1, +1]."""
-        unnormalized = np.asanyarray(unnormalized, dtype=self._space.dtype)
-        low, high = self._space.low, self._space.high
-        intermediary = (unnormalized - low) / (high - low)
-        return (2.0 * intermediary - 1.0) if self._symmetric else intermediary
-
-    def unscale(self, normalized: np.ndarray) -> np.ndarray:
-        """Rescale an array from [−1, +1] to [*low*, *high*]."""
-        normalized = np.asanyarray(normalized, dtype=self._space.dtype)
-        low, high = self._space.low, self._space.high
-        intermediary = 0.5 * (normalized + 1.0) if self._symmetric else normalized
-        return intermediary * (high - low) + low
+        # The bounds are constant, so don't recompute these on each call.
+        # The dtype is compared by identity to skip `np.asanyarray()`.
+        self._dtype = space.dtype
+        self._low = space.low
+        # Length of the box per unit length of the normalized box. Halving
+        # is exact, so folding it in here doesn't change any results.
+        # Not in-place, since integer bounds must turn into floats.
+        width = space.high - space.low
+        self._factor = 0.5 * width if symmetric else width
+        self._scaled_space: Box | None = None
+
+    def scale(
+        self, unnormalized: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Rescale an array from [*low*, *high*] to [−1, +1].
+
+        If *out* is passed, the result is written into it and *out* is
+        returned. It must have the broadcast shape of *unnormalized*
+        and the space, and should have the dtype of the space. This
+        avoids allocating a new array on every call::
+
+            >>> scaler = Scaler(Box(0, 4, (2,)))
+            >>> buffer = np.empty((2,), dtype=np.float32)
+            >>> scaler.scale([1, 3], out=buffer) is buffer
+            True
+            >>> buffer
+            array([-0.5,  0.5], dtype=float32)
+        """
+        if (
+            type(unnormalized) is not np.ndarray
+            or unnormalized.dtype is not self._dtype
+        ):
+            unnormalized = np.asanyarray(unnormalized, dtype=self._dtype)
+        # After the first step, work in-place on the intermediate result.
+        result = np.subtract(unnormalized, self._low, out=out)
+        inplace = _inplace(result)
+        result = np.divide(result, self._factor, out=inplace)
+        if self._symmetric:
+            result = np.subtract(result, 1.0, out=inplace)
+        return result
+
+    def unscale(
+        self, normalized: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Rescale an array from [−1, +1] to [*low*, *high*].
+
+        If *out* is passed, the result is written into it and *out* is
+        returned. The same requirements as for `scale()` apply.
+        """
+        if type(normalized) is not np.ndarray or normalized.dtype is not self._dtype:
+            normalized = np.asanyarray(normalized, dtype=self._dtype)
+        intermediary = normalized
+        if self._symmetric:
+            intermediary = np.add(intermediary, 1.0, out=out)
+            if out is None:
+                out = _inplace(intermediary, self._space.shape)
+        result = np.multiply(intermediary, self._factor, out=out)
+        return np.add(result, self._low, out=_inplace(result))
 
     @property
     def symmetric(self) -> bool:
@@ -161,6 +219,8 @@ class Scaler:
     def scaled_space(self) -> Box:
         """A normalized space with the same shape as `space`.
 
+        This is created on first access and then reused.
+
         Example:
 
             >>> box = Box(5, 8, shape=(3,))
@@ -168,10 +228,55 @@ class Scaler:
             Box(-1.0, 1.0, (3,), float32)
             >>> Scaler(box, symmetric=False).scaled_space
             Box(0.0, 1.0, (3,), float32)
+            >>> scaler = Scaler(box)
+            >>> scaler.scaled_space is scaler.scaled_space
+            True
         """
-        shape = self.space.shape
-        dtype = t.cast(np.dtype[np.floating], self.space.dtype)
-        return Box(-1 if self._symmetric else 0, 1, shape=shape, dtype=dtype.type)
+        if self._scaled_space is None:
+            shape = self._space.shape
+            dtype = t.cast(np.dtype[np.floating], self._dtype)
+            low = -1 if self._symmetric else 0
+            self._scaled_space = Box(low, 1, shape=shape, dtype=dtype.type)
+        return self._scaled_space
+
+
+def _inplace(result: t.Any, shape: tuple[int, ...] = ()) -> np.ndarray | None:
+    """Return *result* if further ufuncs may write into it.
+
+    Ufuncs return scalars instead of 0-d arrays, which cannot be used as
+    output argument. Integer arrays (from integer boxes) cannot hold the
+    float results of the following steps either. If *shape* is passed,
+    *result* is only returned if broadcasting it against *shape* keeps
+    its own shape.
+    """
+    if not isinstance(result, np.ndarray) or not np.issubdtype(
+        result.dtype, np.inexact
+    ):
+        return None
+    ndim = result.ndim - len(shape)
+    if ndim < 0 or result.shape[ndim:] != shape:
+        return None
+    return result
+
+
+# Scalers used by the convenience wrappers, most recently used last.
+# Each scaler keeps its space alive, so no other box can take over its
+# `id()` while it is in the cache.
+_SCALER_CACHE: dict[tuple[int, bool], Scaler] = {}
+_SCALER_CACHE_SIZE = 8
+_SCALER_CACHE_LOCK = threading.Lock()
+
+
+def _get_scaler(space: Box, symmetric: bool) -> Scaler:
+    key = (id(space), symmetric)
+    with _SCALER_CACHE_LOCK:
+        scaler = _SCALER_CACHE.pop(key, None)
+        if scaler is None:
+            scaler = Scaler(space, symmetric=symmetric)
+            if len(_SCALER_CACHE) >= _SCALER_CACHE_SIZE:
+                del _SCALER_CACHE[next(iter(_SCALER_CACHE))]
+        _SCALER_CACHE[key] = scaler
+    return scaler
 
 
 def scale_from_box(
@@ -179,9 +284,12 @@ def scale_from_box(
 ) -> np.ndarray:
     """Normalize an array into [−1; +1] or [0; 1].
 
-    This is a convenience wrapper around `Scaler.scale()`.
+    This is a convenience wrapper around `Scaler.scale()`. The scalers
+    for the most recently used spaces are cached, so calling this in
+    a loop is cheap. Like `~gymnasium.spaces.Box` itself, this does not
+    support modifying the bounds of *space* in-place.
     """
-    return Scaler(space, symmetric=symmetric).scale(unnormalized)
+    return _get_scaler(space, symmetric).scale(unnormalized)
 
 
 def unscale_into_box(
@@ -189,6 +297,7 @@ def unscale_into_box(
 ) -> np.ndarray:
     """Denormalize an array from [−1; +1] or [0; 1].
 
-    This is a convenience wrapper around `Scaler.unscale()`.
+    This is a convenience wrapper around `Scaler.unscale()`. It shares
+    its cache of scalers with `scale_from_box()`.
     """
-    return Scaler(space, symmetric=symmetric).unscale(normalized)
+    return _get_scaler(space, symmetric).unscale(normalized)
@@ -23,12 +23,11 @@ import sys
 import threading
 import typing as t
 from collections import deque
-from functools import update_wrapper
 
 if sys.version_info < (3, 12):
-    from typing_extensions import override
+    from typing_extensions import Self, override
 else:
-    from typing import override
+    from typing import Self, override
 
 if t.TYPE_CHECKING:
     import cern.japc.core
@@ -45,6 +44,7 @@ __all__ = (
     "monitoring",
     "subscribe_stream",
     "subscriptions",
+    "wait_any",
 )
 
 
@@ -59,58 +59,80 @@ class JavaException(Exception):
     """An error occurred on the Java side."""
 
 
-class Header(dict):
+class Header(t.Mapping[str, t.Any]):
     """Convenience wrapper around the JAPC header.
 
-    This is a dict for all intents and purposes, but also allows
-    attribute access to the most common fields.
+    This is a read-only view of the header dict that JAPC passes to the
+    subscription handler. It supports all non-mutating dict operations,
+    but also allows attribute access to the most common fields.
+
+    The header dict is not copied. Use :samp:`dict({header})` if you
+    need a mutable copy.
     """
 
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict[str, t.Any]) -> None:
+        self._data = data
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def __getitem__(self, key: str) -> t.Any:
+        return self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
     @property
     def acquisition_stamp(self) -> datetime.datetime:
         """Accesses the header's acquisition timestamp."""
-        return self["acqStamp"]
+        return self._data["acqStamp"]
 
     @property
     def cycle_stamp(self) -> datetime.datetime:
         """Accesses the header's begin-of-cycle timestamp."""
-        return self["cycleStamp"]
+        return self._data["cycleStamp"]
 
     @property
     def set_stamp(self) -> datetime.datetime:
         """Accesses the header's setting timestamp."""
-        return self["setStamp"]
+        return self._data["setStamp"]
 
     @property
     def selector(self) -> str:
         """Accesses the header's timing selector."""
-        return self["selector"]
+        return self._data["selector"]
 
     @property
     def is_first_update(self) -> bool:
         """Accesses the header's first-update flag."""
-        return self["isFirstUpdate"]
+        return self._data["isFirstUpdate"]
 
     @property
     def is_immediate_update(self) -> bool:
         """Accesses the header's immediate-update flag."""
-        return self["isImmediateUpdate"]
+        return self._data["isImmediateUpdate"]
 
 
 T = t.TypeVar("T")
 _OneOrList = t.Union[T, list[T]]
-_Item = _OneOrList[tuple[object, Header]]
-_Event = t.Union[_Item, JavaException]
-
+# The type of item that a stream returns to the user.
+_ItemT = t.TypeVar("_ItemT")
+# The value(s) and header(s) as received by the subscription handler.
+# They're only turned into an item once the consumer asks for them.
+_Event = t.Union[tuple[t.Any, t.Any], JavaException]
 
-def _unwrap_event(event: _Event) -> _Item:
-    if isinstance(event, JavaException):
-        raise event
-    return event
 
-
-@contextlib.contextmanager
-def subscriptions(japc: "pyjapc.PyJapc") -> t.Iterator["pyjapc.PyJapc"]:
+def subscriptions(
+    japc: "pyjapc.PyJapc",
+) -> contextlib.AbstractContextManager[pyjapc.PyJapc]:
     """Return a :term:`context manager` for `~pyjapc.PyJapc`.
 
     When entering this context, all subscriptions made through the given
@@ -128,21 +150,26 @@ def subscriptions(japc: "pyjapc.PyJapc") -> t.Iterator["pyjapc.PyJapc"]:
         ...         ... # Subscriptions are active here.
         ...     ... # Subscriptions are stopped here.
     """
-    japc.startSubscriptions()
-    try:
-        yield japc
-    finally:
-        japc.stopSubscriptions()
+    return _Subscriptions(japc)
+
 
+class _Subscriptions:
+    """Return type of `subscriptions()`."""
 
-# Fix up return type annotation for the docs.
-subscriptions.__annotations__["return"] = contextlib.AbstractContextManager[
-    "pyjapc.PyJapc"
-]
+    __slots__ = ("_japc",)
 
+    def __init__(self, japc: "pyjapc.PyJapc") -> None:
+        self._japc = japc
 
-@contextlib.contextmanager
-def monitoring(handle: T) -> t.Iterator[T]:
+    def __enter__(self) -> "pyjapc.PyJapc":
+        self._japc.startSubscriptions()
+        return self._japc
+
+    def __exit__(self, *args: object) -> None:
+        self._japc.stopSubscriptions()
+
+
+def monitoring(handle: T) -> contextlib.AbstractContextManager[T]:
     """Return a :term:`context manager` for JAPC subscription handles.
 
     When entering this context, the given subscription handle starts
@@ -160,20 +187,28 @@ def monitoring(handle: T) -> t.Iterator[T]:
         ...         ... # Subscription is active here.
         ...     ... # Subscription are stopped here.
     """
-    # Avoid annotating Java types; bringing them into scope is more of a
-    # headache than it gains us.
-    t.cast(t.Any, handle).startMonitoring()
-    try:
-        yield handle
-    finally:
-        t.cast(t.Any, handle).stopMonitoring()
+    return _Monitoring(handle)
+
+
+class _Monitoring(t.Generic[T]):
+    """Return type of `monitoring()`."""
 
+    __slots__ = ("_handle",)
 
-# Fix up return type annotation for the docs.
-monitoring.__annotations__["return"] = contextlib.AbstractContextManager["T"]  # type: ignore[valid-type]
+    def __init__(self, handle: T) -> None:
+        self._handle = handle
+
+    def __enter__(self) -> T:
+        # Avoid annotating Java types; bringing them into scope is more
+        # of a headache than it gains us.
+        t.cast(t.Any, self._handle).startMonitoring()
+        return self._handle
+
+    def __exit__(self, *args: object) -> None:
+        t.cast(t.Any, self._handle).stopMonitoring()
 
 
-class _BaseStream(metaclass=abc.ABCMeta):
+class _BaseStream(t.Generic[_ItemT], metaclass=abc.ABCMeta):
     """A synchronized PyJapc subscription handle.
 
     Do not instantiate this class yourself. Use
@@ -181,13 +216,11 @@ class _BaseStream(metaclass=abc.ABCMeta):
 
     This class contains the common logic of `ParamStream` and
     `ParamGroupStream`. The subclasses only contain thin wrapper
-    methods that perform some type casting. The whole reason for this
+    methods that specify the item type. The whole reason for this
     setup is to communicate via types whether a stream may return an
     object or a list of objects.
     """
 
-    Self = t.TypeVar("Self", bound="_BaseStream")
-
     def __init__(
         self,
         japc: "pyjapc.PyJapc",
@@ -195,14 +228,18 @@ class _BaseStream(metaclass=abc.ABCMeta):
         *,
         token: cancellation.Token | None,
         maxlen: int | None,
-        **kwargs: t.Any,
+        convert_to_python: bool,
+        selector: str | None,
+        data_filter: dict[str, t.Any] | None,
     ) -> None:
         self._handle = japc.subscribeParam(
             name,
             onValueReceived=self._on_value,
             onException=self._on_exception,
             getHeader=True,
-            **kwargs,
+            noPyConversion=not convert_to_python,
+            timingSelectorOverride=selector,
+            dataFilterOverride=data_filter,
         )
         self._queue: deque[_Event] = deque(maxlen=maxlen)
         # If we get a token, we reuse its condition variable. This is
@@ -210,8 +247,14 @@ class _BaseStream(metaclass=abc.ABCMeta):
         # _or_ a new JAPC event.
         self._token = token
         self._condition = token.wait_handle if token else threading.Condition()
-
-    def __enter__(self: Self) -> Self:
+        # Number of threads blocked in `_pop_or_wait()`. Only modified
+        # while holding `self._condition`.
+        self._waiters = 0
+        # Extra condition variables to notify on new events; used by
+        # `wait_any()`. Only replaced while holding `self._condition`.
+        self._listeners: tuple[threading.Condition, ...] = ()
+
+    def __enter__(self) -> Self:
         self.start_monitoring()
         return self
 
@@ -240,9 +283,13 @@ class _BaseStream(metaclass=abc.ABCMeta):
         if self.monitoring:
             raise StreamError("cannot change cancellation token while monitoring")
         # See comment in __init__(). We need to keep token and condition
-        # variable in sync to not miss any events.
+        # variable in sync to not miss any events. If we already own our
+        # condition variable, keep it.
+        if token:
+            self._condition = token.wait_handle
+        elif self._token:
+            self._condition = threading.Condition()
         self._token = token
-        self._condition = token.wait_handle if token else threading.Condition()
 
     @property
     def monitoring(self) -> bool:
@@ -262,8 +309,7 @@ class _BaseStream(metaclass=abc.ABCMeta):
         with self._condition:
             self._queue.clear()
 
-    @contextlib.contextmanager
-    def locked(self) -> t.Iterator[None]:
+    def locked(self) -> contextlib.AbstractContextManager[object]:
         """Return a :term:`context manager` that locks this stream.
 
         Locking the stream may prevent `TOC/TOU
@@ -299,18 +345,17 @@ class _BaseStream(metaclass=abc.ABCMeta):
             ...         # `pop_or_wait()` while it is locked.
             ...         return stream.pop_or_wait()
         """
-        with self._condition:
-            yield
+        return self._condition
 
     @property
     def ready(self) -> bool:
         """True if there is an event in the queue."""
-        with self._condition:
-            return bool(self._queue)
+        # Threading: Single deque operations are atomic, no need to lock.
+        return bool(self._queue)
 
     @property
     @abc.abstractmethod
-    def oldest(self) -> _Item:
+    def oldest(self) -> _ItemT:
         """The oldest item in the queue.
 
         Raises:
@@ -318,13 +363,11 @@ class _BaseStream(metaclass=abc.ABCMeta):
             JavaException: if an exception occurred on the Java side
                 while receiving this value.
         """
-        with self._condition:
-            event = self._queue[0]
-        return _unwrap_event(event)
+        return self._unwrap_event(self._queue[0])
 
     @property
     @abc.abstractmethod
-    def newest(self) -> _Item:
+    def newest(self) -> _ItemT:
         """The most recent item in the queue.
 
         Raises:
@@ -332,13 +375,11 @@ class _BaseStream(metaclass=abc.ABCMeta):
             JavaException: if an exception occurred on the Java side
                 while receiving this value.
         """
-        with self._condition:
-            event = self._queue[-1]
-        return _unwrap_event(event)
+        return self._unwrap_event(self._queue[-1])
 
     # Tricky: We write the docstring on this internal method and
     # dynamically copy it onto the public method in the subclasses.
-    def _pop_or_wait(self, timeout: float | None) -> _Item | None:
+    def _pop_or_wait(self, timeout: float | None) -> _ItemT | None:
         """Return the next item from the queue or wait for one.
 
         If there already is an item in the queue, it is removed and this
@@ -366,28 +407,52 @@ class _BaseStream(metaclass=abc.ABCMeta):
                 active and no timeout has been specified; this serves to
                 prevent a deadlock in the application.
         """
-        # Prevent deadlock.
-        if not self.monitoring and timeout is None and not self._queue:
+        # Prevent deadlock. Check `monitoring` last, it calls into Java.
+        if timeout is None and not self._queue and not self.monitoring:
             raise StreamError("would deadlock")
         with self._condition:
-            if self._token:
-                self._token.raise_if_cancellation_requested()
-            while not self._queue:
-                # Threading: This wait may return for three reasons: 1.
-                # a new item has arrived, 2. our cancellation token has
-                # been cancelled, 3. the timeout has expired. We must
-                # check all three.
-                success = self._condition.wait(timeout)
-                if self._token:
-                    self._token.raise_if_cancellation_requested()
-                if not success:
-                    return None
-            event = self._queue.popleft()
-        return _unwrap_event(event)
+            event = self._pop_or_wait_locked(timeout)
+        return None if event is None else self._unwrap_event(event)
+
+    def _pop_or_wait_locked(self, timeout: float | None) -> _Event | None:
+        """Implementation of `pop_or_wait()`.
+
+        Must be called while holding `self._condition`. Returns the
+        event without unwrapping it.
+        """
+        queue = self._queue
+        token = self._token
+        if token:
+            token.raise_if_cancellation_requested()
+        if not queue:
+            # Threading: We may wake up for three reasons: 1. a new
+            # item has arrived, 2. our cancellation token has been
+            # cancelled, 3. the timeout has expired. `wait_for()`
+            # goes back to sleep (without resetting the timeout) if
+            # another thread has popped the new item before us.
+            self._waiters += 1
+            try:
+                self._condition.wait_for(
+                    lambda: queue or (token and token.cancellation_requested),
+                    timeout,
+                )
+            finally:
+                self._waiters -= 1
+            if token:
+                token.raise_if_cancellation_requested()
+            if not queue:
+                return None
+        event = queue.popleft()
+        if queue and self._waiters and self._token is None:
+            # Threading: `_notify()` wakes only one waiter per item. If
+            # one of them left without popping (e.g. due to an
+            # exception), pass its wake-up on to the next one.
+            self._condition.notify()
+        return event
 
     # Tricky: We write the docstring on this internal method and
     # dynamically copy it onto the public method in the subclasses.
-    def _pop_if_ready(self) -> _Item | None:
+    def _pop_if_ready(self) -> _ItemT | None:
         """Return the next value or None if the queue is empty.
 
         This is similar to ``pop_or_wait(timeout=0.0)``, but never
@@ -397,15 +462,50 @@ class _BaseStream(metaclass=abc.ABCMeta):
             JavaException: if an exception occurred on the Java side
                 while receiving this value.
         """
+        # Threading: Don't bother locking if there's nothing to pop.
+        if not self._queue:
+            return None
         with self._condition:
             if self._queue:
                 event = self._queue.popleft()
-                return _unwrap_event(event)
+                return self._unwrap_event(event)
         return None
 
     # Tricky: We write the docstring on this internal method and
     # dynamically copy it onto the public method in the subclasses.
-    def _wait_for_next(self, timeout: float | None = None) -> _Item | None:
+    def _drain(self) -> list[_ItemT]:
+        """Remove and return all values in the queue.
+
+        This is like calling `pop_if_ready()` until it returns None,
+        but locks the stream only once. Like `pop_if_ready()`, it never
+        blocks and never checks the token for a cancellation request.
+
+        Returns:
+            A list of all values in the queue, oldest first. The list is
+            empty if the queue is empty.
+
+        Raises:
+            JavaException: if an exception occurred on the Java side
+                while receiving the oldest value. If it occurred on a
+                later value, all values before it are returned and the
+                exception is raised by the next call.
+        """
+        items: list[_ItemT] = []
+        # Threading: Don't bother locking if there's nothing to pop.
+        if not self._queue:
+            return items
+        with self._condition:
+            queue = self._queue
+            while queue:
+                # Return what we have; the next call raises the error.
+                if items and isinstance(queue[0], JavaException):
+                    break
+                items.append(self._unwrap_event(queue.popleft()))
+        return items
+
+    # Tricky: We write the docstring on this internal method and
+    # dynamically copy it onto the public method in the subclasses.
+    def _wait_for_next(self, timeout: float | None = None) -> _ItemT | None:
         """Clear the queue and wait for a new item to arrive.
 
         This is like calling `clear()` followed by
@@ -431,29 +531,50 @@ class _BaseStream(metaclass=abc.ABCMeta):
                 timeout has been specified; this serves to prevent a
                 deadlock in the application.
         """
-        with self.locked():
-            self.clear()
-            return self._pop_or_wait(timeout)
+        with self._condition:
+            self._queue.clear()
+            # Prevent deadlock.
+            if timeout is None and not self.monitoring:
+                raise StreamError("would deadlock")
+            event = self._pop_or_wait_locked(timeout)
+        return None if event is None else self._unwrap_event(event)
 
-    def _on_value(
-        self,
-        names: _OneOrList[str],
-        values: t.Any,
-        headers: _OneOrList[dict] | None,
+    @abc.abstractmethod
+    def _on_value(self, names: t.Any, values: t.Any, headers: t.Any) -> None:
+        """Subscription handler, specialized by each subclass."""
+
+    @abc.abstractmethod
+    def _make_item(self, values: t.Any, headers: t.Any) -> _ItemT:
+        """Turn a received event into the item returned to the user."""
+
+    def _unwrap_event(self, event: _Event) -> _ItemT:
+        if isinstance(event, JavaException):
+            raise event
+        return self._make_item(*event)
+
+    def _on_exception(
+        self, _names: _OneOrList[str], _desc: str, exc: Exception
     ) -> None:
-        assert headers is not None, "we always pass getHeader=True"
+        self._enqueue(JavaException(exc))
+
+    def _enqueue(self, event: _Event) -> None:
+        # Build the event before calling this to keep the critical
+        # section short.
         with self._condition:
-            event: _Event
-            if isinstance(names, str):
-                event = (t.cast(object, values), Header(t.cast(dict, headers)))
-            else:
-                event = [
-                    (value, Header(header))
-                    for value, header in zip(
-                        t.cast(list[object], values), t.cast(list[dict], headers)
-                    )
-                ]
             self._queue.append(event)
+            self._notify()
+        # Threading: Notify listeners after releasing our lock, so that
+        # we never hold two locks at once.
+        for listener in self._listeners:
+            with listener:
+                listener.notify_all()
+
+    def _notify(self) -> None:
+        """Wake up threads waiting for new data.
+
+        Must be called while holding `self._condition`.
+        """
+        if self._token is not None:
             # Threading: Notify all will wake up all threads waiting for
             # new data. They will race for `self._condition` and only
             # one will acquire it and successfully pop off the queue.
@@ -464,17 +585,15 @@ class _BaseStream(metaclass=abc.ABCMeta):
             # only on the token might be woken up and none of the
             # threads waiting on the queue would be the wiser.
             self._condition.notify_all()
-
-    def _on_exception(
-        self, _names: _OneOrList[str], _desc: str, exc: Exception
-    ) -> None:
-        with self._condition:
-            self._queue.append(JavaException(exc))
-            # Threading: See comment in `_on_value()`.
-            self._condition.notify_all()
+        elif self._waiters:
+            # Threading: Nobody else knows our condition variable, so
+            # all waiters are waiting for the queue. Only one of them
+            # can pop the new item, so there's no point in waking the
+            # others.
+            self._condition.notify()
 
 
-class ParamStream(_BaseStream):
+class ParamStream(_BaseStream[tuple[object, Header]]):
     """A synchronized handle to a one-parameter PyJapc subscription.
 
     Typically you use `subscribe_stream()` to instantiate this
@@ -492,9 +611,19 @@ class ParamStream(_BaseStream):
         *,
         token: cancellation.Token | None,
         maxlen: int | None,
-        **kwargs: t.Any,
+        convert_to_python: bool = True,
+        selector: str | None = None,
+        data_filter: dict[str, t.Any] | None = None,
     ) -> None:
-        super().__init__(japc, name, token=token, maxlen=maxlen, **kwargs)
+        super().__init__(
+            japc,
+            name,
+            token=token,
+            maxlen=maxlen,
+            convert_to_python=convert_to_python,
+            selector=selector,
+            data_filter=data_filter,
+        )
 
     def __str__(self) -> str:
         return f"<{type(self).__name__}({self.parameter_name!r})>"
@@ -506,6 +635,15 @@ class ParamStream(_BaseStream):
             f"{self._queue.maxlen!r})>"
         )
 
+    @override
+    def _on_value(self, _name: str, value: object, header: dict | None) -> None:
+        assert header is not None, "we always pass getHeader=True"
+        self._enqueue((value, header))
+
+    @override
+    def _make_item(self, value: object, header: dict) -> tuple[object, Header]:
+        return value, Header(header)
+
     @property
     def parameter_name(self) -> str:
         """The name of the stream's underlying parameter."""
@@ -515,12 +653,12 @@ class ParamStream(_BaseStream):
     @property
     @override
     def oldest(self) -> tuple[object, Header]:
-        return t.cast(tuple[object, Header], super().oldest)
+        return super().oldest
 
     @property
     @override
     def newest(self) -> tuple[object, Header]:
-        return t.cast(tuple[object, Header], super().newest)
+        return super().newest
 
     @t.overload
     def pop_or_wait(self) -> tuple[object, Header]: ...
@@ -531,16 +669,19 @@ class ParamStream(_BaseStream):
     def pop_or_wait(  # noqa: D102
         self, timeout: float | None = None
     ) -> tuple[object, Header] | None:
-        return t.cast(tuple[object, Header], super()._pop_or_wait(timeout))
+        return self._pop_or_wait(timeout)
 
-    # Workaround for <https://github.com/python/mypy/issues/17166>.
-    update_wrapper(pop_or_wait, _BaseStream._pop_or_wait, assigned=["__doc__"])
+    pop_or_wait.__doc__ = _BaseStream._pop_or_wait.__doc__
 
     def pop_if_ready(self) -> tuple[object, Header] | None:  # noqa: D102
-        return t.cast(tuple[object, Header], super()._pop_if_ready())
+        return self._pop_if_ready()
 
-    # Workaround for <https://github.com/python/mypy/issues/17166>.
-    update_wrapper(pop_if_ready, _BaseStream._pop_if_ready, assigned=["__doc__"])
+    pop_if_ready.__doc__ = _BaseStream._pop_if_ready.__doc__
+
+    def drain(self) -> list[tuple[object, Header]]:  # noqa: D102
+        return self._drain()
+
+    drain.__doc__ = _BaseStream._drain.__doc__
 
     @t.overload
     def wait_for_next(self) -> tuple[object, Header]: ...
@@ -551,13 +692,12 @@ class ParamStream(_BaseStream):
     def wait_for_next(  # noqa: D102
         self, timeout: float | None = None
     ) -> tuple[object, Header] | None:
-        return t.cast(tuple[object, Header], super()._wait_for_next(timeout))
+        return self._wait_for_next(timeout)
 
-    # Workaround for <https://github.com/python/mypy/issues/17166>.
-    update_wrapper(wait_for_next, _BaseStream._wait_for_next, assigned=["__doc__"])
+    wait_for_next.__doc__ = _BaseStream._wait_for_next.__doc__
 
 
-class ParamGroupStream(_BaseStream):
+class ParamGroupStream(_BaseStream[list[tuple[object, Header]]]):
     """A synchronized handle to a multi-parameter PyJapc subscription.
 
     Typically you use `subscribe_stream()` to instantiate this
@@ -575,9 +715,19 @@ class ParamGroupStream(_BaseStream):
         *,
         token: cancellation.Token | None,
         maxlen: int | None,
-        **kwargs: t.Any,
+        convert_to_python: bool = True,
+        selector: str | None = None,
+        data_filter: dict[str, t.Any] | None = None,
     ) -> None:
-        super().__init__(japc, name, token=token, maxlen=maxlen, **kwargs)
+        super().__init__(
+            japc,
+            name,
+            token=token,
+            maxlen=maxlen,
+            convert_to_python=convert_to_python,
+            selector=selector,
+            data_filter=data_filter,
+        )
 
     def __str__(self) -> str:
         return f"<{type(self).__name__} of {len(self.parameter_names)} parameters>"
@@ -589,6 +739,21 @@ class ParamGroupStream(_BaseStream):
             f"{self._queue.maxlen!r})>"
         )
 
+    @override
+    def _on_value(
+        self, _names: list[str], values: list[object], headers: list[dict] | None
+    ) -> None:
+        assert headers is not None, "we always pass getHeader=True"
+        # Don't pair values and headers yet; in a bounded queue, most
+        # events may get pushed out before anyone retrieves them.
+        self._enqueue((values, headers))
+
+    @override
+    def _make_item(
+        self, values: list[object], headers: list[dict]
+    ) -> list[tuple[object, Header]]:
+        return list(zip(values, map(Header, headers)))
+
     @property
     def parameter_names(self) -> tuple[str, ...]:
         """A list with the names of all underlying parameters."""
@@ -601,12 +766,12 @@ class ParamGroupStream(_BaseStream):
     @property
     @override
     def oldest(self) -> list[tuple[object, Header]]:
-        return t.cast(list[tuple[object, Header]], super().oldest)
+        return super().oldest
 
     @property
     @override
     def newest(self) -> list[tuple[object, Header]]:
-        return t.cast(list[tuple[object, Header]], super().newest)
+        return super().newest
 
     @t.overload
     def pop_or_wait(self) -> list[tuple[object, Header]]: ...
@@ -617,16 +782,19 @@ class ParamGroupStream(_BaseStream):
     def pop_or_wait(  # noqa: D102
         self, timeout: float | None = None
     ) -> list[tuple[object, Header]] | None:
-        return t.cast(list[tuple[object, Header]], super()._pop_or_wait(timeout))
+        return self._pop_or_wait(timeout)
 
-    # Workaround for <https://github.com/python/mypy/issues/17166>.
-    update_wrapper(pop_or_wait, _BaseStream._pop_or_wait, assigned=["__doc__"])
+    pop_or_wait.__doc__ = _BaseStream._pop_or_wait.__doc__
 
     def pop_if_ready(self) -> list[tuple[object, Header]] | None:  # noqa: D102
-        return t.cast(list[tuple[object, Header]], super()._pop_if_ready())
+        return self._pop_if_ready()
+
+    pop_if_ready.__doc__ = _BaseStream._pop_if_ready.__doc__
+
+    def drain(self) -> list[list[tuple[object, Header]]]:  # noqa: D102
+        return self._drain()
 
-    # Workaround for <https://github.com/python/mypy/issues/17166>.
-    update_wrapper(pop_if_ready, _BaseStream._pop_if_ready, assigned=["__doc__"])
+    drain.__doc__ = _BaseStream._drain.__doc__
 
     @t.overload
     def wait_for_next(self) -> list[tuple[object, Header]]: ...
@@ -637,10 +805,9 @@ class ParamGroupStream(_BaseStream):
     def wait_for_next(  # noqa: D102
         self, timeout: float | None = None
     ) -> list[tuple[object, Header]] | None:
-        return t.cast(list[tuple[object, Header]], super()._wait_for_next(timeout))
+        return self._wait_for_next(timeout)
 
-    # Workaround for <https://github.com/python/mypy/issues/17166>.
-    update_wrapper(wait_for_next, _BaseStream._wait_for_next, assigned=["__doc__"])
+    wait_for_next.__doc__ = _BaseStream._wait_for_next.__doc__
 
 
 @t.overload
@@ -738,15 +905,94 @@ def subscribe_stream(
         ...     values, headers = zip(*values_and_headers)
         ...     ...
     """
-    subscribe_kwargs: dict[str, t.Any] = {"noPyConversion": not convert_to_python}
-    if selector is not None:
-        subscribe_kwargs["timingSelectorOverride"] = selector
-    if data_filter is not None:
-        subscribe_kwargs["dataFilterOverride"] = data_filter
     if isinstance(name_or_names, str):
         return ParamStream(
-            japc, name_or_names, token=token, maxlen=maxlen, **subscribe_kwargs
+            japc,
+            name_or_names,
+            token=token,
+            maxlen=maxlen,
+            convert_to_python=convert_to_python,
+            selector=selector,
+            data_filter=data_filter,
         )
     return ParamGroupStream(
-        japc, name_or_names, token=token, maxlen=maxlen, **subscribe_kwargs
+        japc,
+        name_or_names,
+        token=token,
+        maxlen=maxlen,
+        convert_to_python=convert_to_python,
+        selector=selector,
+        data_filter=data_filter,
     )
+
+
+StreamT = t.TypeVar("StreamT", bound=_BaseStream[t.Any])
+
+
+def wait_any(
+    streams: t.Iterable[StreamT], timeout: float | None = None
+) -> StreamT | None:
+    """Wait until any of multiple streams has a value.
+
+    This allows a single thread to serve multiple streams without
+    polling them. The value itself is not removed from the stream;
+    use e.g. `~ParamStream.pop_if_ready()` on the returned stream to
+    retrieve it.
+
+    Args:
+        streams: The `ParamStream` and `ParamGroupStream` objects to
+            wait for.
+        timeout: If passed and not None, the amount of time (in seconds)
+            for which to wait if no stream has a value.
+
+    Returns:
+        The first stream (in the order given) that has a value. None if
+        the specified timeout elapses before any stream has received
+        a value.
+
+    Raises:
+        StreamError: if no stream has a value, none is monitoring its
+            parameter and no timeout has been specified; this serves to
+            prevent a deadlock in the application.
+
+    Note:
+        Unlike `~ParamStream.pop_or_wait()`, this function does not
+        watch the streams' cancellation tokens. Pass a timeout if you
+        need to check for cancellation periodically.
+
+    Example:
+
+        >>> def serve(streams: t.List[ParamStream]) -> None:
+        ...     with contextlib.ExitStack() as stack:
+        ...         for stream in streams:
+        ...             stack.enter_context(stream)
+        ...         while True:
+        ...             stream = wait_any(streams)
+        ...             value, header = stream.pop_if_ready()
+        ...             ...
+    """
+    streams = list(streams)
+
+    def first_ready() -> StreamT | None:
+        return next((stream for stream in streams if stream.ready), None)
+
+    ready = first_ready()
+    if ready is not None:
+        return ready
+    if timeout is None and not any(stream.monitoring for stream in streams):
+        raise StreamError("would deadlock")
+    condition = threading.Condition()
+    for stream in streams:
+        with stream._condition:
+            stream._listeners = (*stream._listeners, condition)
+    try:
+        with condition:
+            return condition.wait_for(first_ready, timeout)
+    finally:
+        for stream in streams:
+            with stream._condition:
+                stream._listeners = tuple(
+                    listener
+                    for listener in stream._listeners
+                    if listener is not condition
+                )
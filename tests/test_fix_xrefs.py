@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2020-2024 CERN
+# SPDX-FileCopyrightText: 2023-2024 GSI Helmholtzzentrum für Schwerionenforschung
+# SPDX-FileNotice: All rights not expressly granted are reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later OR EUPL-1.2+
+
+"""Tests for the ``fix_xrefs`` Sphinx extension in :file:`docs/_ext`."""
+
+from __future__ import annotations
+
+import ast
+import re
+import sys
+import typing as t
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sphinx")
+
+DOCS_DIR = Path(__file__).absolute().parent.parent / "docs"
+sys.path.append(str(DOCS_DIR / "_ext"))
+
+import fix_xrefs  # type: ignore[import-not-found]
+
+
+def _configured_rules() -> list[fix_xrefs.XrefRule]:
+    # Don't execute conf.py, it needs the installed distribution.
+    tree = ast.parse((DOCS_DIR / "conf.py").read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "fix_xrefs_rules"
+            for target in node.targets
+        ):
+            return t.cast(list[fix_xrefs.XrefRule], ast.literal_eval(node.value))
+    raise AssertionError("fix_xrefs_rules not found in conf.py")
+
+
+def test_configured_rules_use_prefix_filter() -> None:
+    compiled = fix_xrefs.CompiledRules.compile(_configured_rules())
+    assert compiled.prefixes
+    assert not compiled.unprefixed
+    assert compiled.find("builtins.int") is None
+    found = compiled.find("cernml.japc_utils.StreamT")
+    assert found
+    rule, _ = found
+    assert rule["reftarget"] == (fix_xrefs.TransformKind.CONST, "typing.TypeVar")
+
+
+def test_unprefixed_rule_is_always_tried() -> None:
+    compiled = fix_xrefs.CompiledRules.compile(
+        [
+            {"pattern": r"^np\.", "reftarget": ("sub", "numpy.")},
+            {"pattern": r"Value$", "reftarget": ("const", "value.Value")},
+        ]
+    )
+    assert compiled.prefixes == ("np.",)
+    assert compiled.unprefixed == (1,)
+    found = compiled.find("commons.Value")
+    assert found
+    assert found[0]["pattern"] == r"Value$"
+    assert compiled.find("commons.Other") is None
+
+
+@pytest.mark.parametrize(
+    ("pattern", "prefix"),
+    [
+        (r"^cernml\..*\.(?:T|StreamT)$", "cernml."),
+        (r"^cernml\.(?:a|b)", "cernml."),
+        (r"^a[|]", "a"),
+        (r"^a|b", ""),
+        (r"^(a)|b", ""),
+    ],
+)
+def test_literal_prefix_alternation(pattern: str, prefix: str) -> None:
+    assert fix_xrefs.literal_prefix(re.compile(pattern)) == prefix
@@ -89,3 +89,45 @@ def test_unscale_is_monotonic(space: Box) -> None:
     points.sort(axis=0)
     unscaled = unscale_into_box(space, points)
     assert np.array_equal(unscaled, np.sort(unscaled, axis=0))
+
+
+def test_out_parameter(space: Box) -> None:
+    scaler = Scaler(space)
+    points = np.array([space.sample() for _ in range(4)])
+    buffer = np.empty_like(points)
+    assert scaler.scale(points, out=buffer) is buffer
+    assert np.array_equal(buffer, scaler.scale(points))
+    assert scaler.unscale(points, out=buffer) is buffer
+    assert np.array_equal(buffer, scaler.unscale(points))
+
+
+@pytest.mark.parametrize("symmetric", [True, False])
+def test_integer_box(symmetric: bool) -> None:
+    space = Box(0, 10, shape=(2,), dtype=np.int64)
+    scaler = Scaler(space, symmetric=symmetric)
+    low = -1.0 if symmetric else 0.0
+    scaled = scaler.scale(np.array([0, 10]))
+    assert np.issubdtype(scaled.dtype, np.floating)
+    assert np.array_equal(scaled, [low, 1.0])
+    assert np.array_equal(scaler.unscale(np.array([low, 1.0])), [0, 10])
+
+
+def test_wrappers_respect_new_spaces() -> None:
+    for i in range(20):
+        space = Box(i, i + 2, shape=(2,), dtype=np.float64)
+        assert np.array_equal(scale_from_box(space, space.high), [1.0, 1.0])
+        assert np.array_equal(
+            unscale_into_box(space, np.array([0.0, 1.0]), symmetric=False), [i, i + 2]
+        )
+
+
+def test_scaler_batches(space: Box) -> None:
+    scaler = Scaler(space)
+    points = np.array([space.sample() for _ in range(5)])
+    scaled = scaler.scale(points)
+    assert scaled.shape == points.shape
+    for point, expected in zip(points, scaled):
+        assert np.array_equal(scaler.scale(point), expected)
+    unscaled = scaler.unscale(scaled)
+    for point, expected in zip(scaled, unscaled):
+        assert np.array_equal(scaler.unscale(point), expected)
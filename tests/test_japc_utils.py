@@ -203,6 +203,19 @@ def test_header() -> None:
     assert header.is_immediate_update is header["isImmediateUpdate"]
 
 
+def test_header_is_read_only_view() -> None:
+    data = {"selector": "SPS.USER.ALL"}
+    header = japc_utils.Header(data)
+    assert header == data
+    assert dict(header) == data
+    assert "selector" in header
+    assert header.get("acqStamp") is None
+    with pytest.raises(TypeError):
+        header["selector"] = ""  # type: ignore[index]
+    data["acqStamp"] = stamp = Mock()
+    assert header.acquisition_stamp is stamp
+
+
 def test_str_single() -> None:
     name = "single_name"
     stream = japc_utils.subscribe_stream(mock_japc([]), name)
@@ -253,6 +266,18 @@ def test_timing_selector_and_data_filter() -> None:
     assert handle.init_kwargs == expected
 
 
+def test_default_subscription_options() -> None:
+    expected = {
+        "timingSelectorOverride": None,
+        "dataFilterOverride": None,
+        "getHeader": True,
+        "noPyConversion": True,
+    }
+    stream = japc_utils.subscribe_stream(mock_japc([]), "", convert_to_python=False)
+    handle = extract_mock_handle(stream)
+    assert handle.init_kwargs == expected
+
+
 def test_receive_values() -> None:
     expected = [Mock(name=f"Sent #{i+1}") for i in range(3)]
     japc = mock_japc(expected)
@@ -293,6 +318,20 @@ def test_raise_if_not_monitoring() -> None:
     assert stream.pop_or_wait(MockJapc.TIME_STEP_SECONDS) is None
 
 
+def test_wait_for_next_raises_if_not_monitoring() -> None:
+    japc = mock_japc([Mock()])
+    stream = japc_utils.subscribe_stream(japc, "")
+    with stream:
+        handle = extract_mock_handle(stream)
+        assert handle.thread is not None
+        handle.thread.join()
+    assert stream.ready
+    with pytest.raises(japc_utils.StreamError):
+        stream.wait_for_next()
+    assert not stream.ready
+    assert stream.wait_for_next(MockJapc.TIME_STEP_SECONDS) is None
+
+
 def test_queue_maxlen_is_one() -> None:
     sent_values = [Mock(name=f"Sent value #{i+1}") for i in range(3)]
     japc = mock_japc(sent_values)
@@ -317,6 +356,59 @@ def test_queue_without_maxlen() -> None:
     assert all_available == sent_values
 
 
+def test_multiple_consumers() -> None:
+    sent_values = [Mock(name=f"Sent value #{i+1}") for i in range(3)]
+    japc = mock_japc(sent_values)
+    stream = japc_utils.subscribe_stream(japc, "", maxlen=None)
+    received: list[object] = []
+
+    def consume() -> None:
+        item = stream.pop_or_wait(20 * MockJapc.TIME_STEP_SECONDS)
+        assert item is not None
+        received.append(item[0])
+
+    consumers = [threading.Thread(target=consume) for _ in sent_values]
+    with stream:
+        for consumer in consumers:
+            consumer.start()
+        for consumer in consumers:
+            consumer.join()
+    assert len(received) == len(sent_values)
+    assert set(received) == set(sent_values)
+
+
+@pytest.mark.parametrize("name", ["", [""]])
+def test_drain(name: str | list[str]) -> None:
+    sent_values = [Mock(name=f"Sent value #{i+1}") for i in range(3)]
+    expected_return_values = [
+        (v, ANY) if isinstance(name, str) else [(v, ANY)] for v in sent_values
+    ]
+    japc = mock_japc(sent_values)
+    stream = japc_utils.subscribe_stream(japc, name, maxlen=None)
+    assert stream.drain() == []
+    with stream:
+        handle = extract_mock_handle(stream)
+        assert handle.thread is not None
+        handle.thread.join()
+    assert stream.drain() == expected_return_values
+    assert not stream.ready
+    assert stream.drain() == []
+
+
+def test_drain_stops_at_exception() -> None:
+    sent_values = [Mock(), ValueError(), Mock()]
+    japc = mock_japc(sent_values)
+    stream = japc_utils.subscribe_stream(japc, "", maxlen=None)
+    with stream:
+        handle = extract_mock_handle(stream)
+        assert handle.thread is not None
+        handle.thread.join()
+    assert [value for value, _ in stream.drain()] == sent_values[:1]
+    with pytest.raises(japc_utils.JavaException):
+        stream.drain()
+    assert [value for value, _ in stream.drain()] == sent_values[2:]
+
+
 def test_pop_if_ready_doesnt_block() -> None:
     sent_values = [Mock() for _ in range(2)]
     japc = mock_japc(sent_values)
@@ -378,6 +470,9 @@ def test_stream_token() -> None:
     stream.token = None
     assert new_token is not stream.token
     assert stream.token is None
+    condition = stream._condition
+    stream.token = None
+    assert stream._condition is condition
 
 
 @pytest.mark.parametrize("name", ["", [""]])
@@ -486,3 +581,26 @@ def test_cancel_breaks_deadlock() -> None:
     canceller.join()
     assert not stream.ready
     assert received_values == sent_values
+
+
+def test_wait_any() -> None:
+    sent_value = Mock(name="Sent value")
+    japc = mock_japc({"silent": [], "busy": [sent_value]})
+    silent = japc_utils.subscribe_stream(japc, "silent")
+    busy = japc_utils.subscribe_stream(japc, "busy")
+    with silent, busy:
+        assert japc_utils.wait_any([silent, busy]) is busy
+        assert japc_utils.wait_any([silent, busy]) is busy
+        value, _ = busy.pop_or_wait()
+        assert value is sent_value
+        assert japc_utils.wait_any([silent, busy], MockJapc.TIME_STEP_SECONDS) is None
+    assert not silent._listeners
+    assert not busy._listeners
+
+
+def test_wait_any_raises_if_not_monitoring() -> None:
+    japc = mock_japc([])
+    streams = [japc_utils.subscribe_stream(japc, name) for name in ["a", "b"]]
+    with pytest.raises(japc_utils.StreamError):
+        japc_utils.wait_any(streams)
+    assert japc_utils.wait_any(streams, MockJapc.TIME_STEP_SECONDS) is None